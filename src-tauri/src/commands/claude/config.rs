@@ -442,7 +442,14 @@ fn find_claude_md_recursive(
             }
         }
 
-        if path.is_dir() {
+        // Use the entry's file type to avoid an extra stat per path and to
+        // avoid following symlinks into directory cycles
+        let file_type = match entry.file_type() {
+            Ok(file_type) => file_type,
+            Err(_) => continue,
+        };
+
+        if file_type.is_dir() {
             // Skip common directories that shouldn't be searched
             if let Some(dir_name) = path.file_name().and_then(|n| n.to_str()) {
                 if matches!(
@@ -454,8 +461,9 @@ fn find_claude_md_recursive(
             }
 
             find_claude_md_recursive(&path, project_root, claude_files)?;
-        } else if path.is_file() {
-            // Check if it's a CLAUDE.md file (case insensitive)
+        } else if file_type.is_file() || (file_type.is_symlink() && path.is_file()) {
+            // Check if it's a CLAUDE.md file (case insensitive); symlinked
+            // files such as CLAUDE.md -> AGENTS.md are still matched
             if let Some(file_name) = path.file_name().and_then(|n| n.to_str()) {
                 if file_name.eq_ignore_ascii_case("CLAUDE.md") {
                     let metadata = fs::metadata(&path)
@@ -961,3 +969,23 @@ pub async fn save_codex_system_prompt(content: String) -> Result<String, String>
     Ok("Codex 系统提示词保存成功".to_string())
 }
 
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[cfg(unix)]
+    #[tokio::test]
+    async fn test_find_claude_md_files_includes_symlinked_file() {
+        let dir = tempfile::tempdir().unwrap();
+        fs::write(dir.path().join("AGENTS.md"), "# Agents").unwrap();
+        std::os::unix::fs::symlink("AGENTS.md", dir.path().join("CLAUDE.md")).unwrap();
+
+        let result = find_claude_md_files(dir.path().to_string_lossy().to_string())
+            .await
+            .unwrap();
+
+        assert_eq!(result.len(), 1);
+        assert_eq!(result[0].relative_path, "CLAUDE.md");
+        assert_eq!(result[0].size, "# Agents".len() as u64);
+    }
+}
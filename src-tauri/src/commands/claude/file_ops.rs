@@ -211,8 +211,10 @@ fn search_files_recursive(
             }
         }
 
-        // Recurse into directories
-        if entry_path.is_dir() {
+        // Recurse into directories (file_type comes from the directory entry,
+        // so this avoids an extra stat and does not follow symlinks)
+        let is_dir = entry.file_type().map(|t| t.is_dir()).unwrap_or(false);
+        if is_dir {
             // Skip common directories that shouldn't be searched
             if let Some(dir_name) = entry_path.file_name().and_then(|n| n.to_str()) {
                 if matches!(
@@ -246,4 +248,40 @@ mod tests {
         assert!(result.is_ok());
         assert_eq!(result.unwrap().len(), 0);
     }
+
+    #[cfg(unix)]
+    #[tokio::test]
+    async fn test_search_files_does_not_follow_symlinked_dirs() {
+        let dir = tempfile::tempdir().unwrap();
+        let real = dir.path().join("real");
+        fs::create_dir(&real).unwrap();
+        fs::write(real.join("needle.txt"), "").unwrap();
+        std::os::unix::fs::symlink(&real, dir.path().join("linked")).unwrap();
+
+        let result = search_files(
+            dir.path().to_string_lossy().to_string(),
+            "needle".to_string(),
+        )
+        .await
+        .unwrap();
+
+        assert_eq!(result.len(), 1);
+        assert_eq!(PathBuf::from(&result[0].path), real.join("needle.txt"));
+    }
+
+    #[cfg(unix)]
+    #[tokio::test]
+    async fn test_search_files_terminates_on_symlink_cycle() {
+        let dir = tempfile::tempdir().unwrap();
+        let sub = dir.path().join("sub");
+        fs::create_dir(&sub).unwrap();
+        std::os::unix::fs::symlink(dir.path(), sub.join("loop")).unwrap();
+
+        let result = search_files(dir.path().to_string_lossy().to_string(), "loop".to_string())
+            .await
+            .unwrap();
+
+        assert_eq!(result.len(), 1);
+        assert_eq!(PathBuf::from(&result[0].path), sub.join("loop"));
+    }
 }